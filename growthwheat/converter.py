@@ -23,6 +23,33 @@ ELEMENT_TOPOLOGY_COLUMNS = ['plant', 'axis', 'metamer', 'organ', 'element']
 ROOT_TOPOLOGY_COLUMNS = ['plant', 'axis', 'organ']
 AXIS_TOPOLOGY_COLUMNS = ['plant', 'axis']
 
+#: the key, the topology columns and the sorted columns of each dataframe built by :func:`to_dataframes`
+OUTPUTS_DATAFRAMES_COLUMNS = (('hiddenzone', HIDDENZONE_TOPOLOGY_COLUMNS, HIDDENZONE_TOPOLOGY_COLUMNS + simulation.HIDDENZONE_OUTPUTS),
+                              ('elements', ELEMENT_TOPOLOGY_COLUMNS, ELEMENT_TOPOLOGY_COLUMNS + simulation.ELEMENT_OUTPUTS),
+                              ('roots', ROOT_TOPOLOGY_COLUMNS, ROOT_TOPOLOGY_COLUMNS + simulation.ROOT_OUTPUTS),
+                              ('axes', AXIS_TOPOLOGY_COLUMNS, AXIS_TOPOLOGY_COLUMNS + simulation.AXIS_OUTPUTS))
+
+
+def _dataframe_to_dict(dataframe, topology_columns):
+    """
+    Convert a dataframe to a dictionary of dictionaries, with one entry by topological element.
+    Only the first line of each topological element is kept.
+
+    :param pandas.DataFrame dataframe: The dataframe to convert, with one line by topological element.
+    :param list topology_columns: The columns which define the topology in `dataframe`.
+
+    :return: The data of `dataframe` indexed by the topological elements ids.
+    :rtype: dict [tuple, dict]
+    """
+    data_columns = dataframe.columns.difference(topology_columns).tolist()
+    nb_topology_columns = len(topology_columns)
+    data_dict = {}
+    for row in dataframe[topology_columns + data_columns].itertuples(index=False, name=None):
+        id_ = row[:nb_topology_columns]
+        if id_ not in data_dict:
+            data_dict[id_] = dict(zip(data_columns, row[nb_topology_columns:]))
+    return data_dict
+
 
 def from_dataframes(hiddenzone_inputs, element_inputs, root_inputs, axis_inputs):
     """
@@ -38,39 +65,10 @@ def from_dataframes(hiddenzone_inputs, element_inputs, root_inputs, axis_inputs)
 
     .. seealso:: see :attr:`simulation.Simulation.inputs` for the structure of Growth-Wheat inputs.
     """
-    all_hiddenzone_dict = {}
-    all_element_dict = {}
-    all_root_dict = {}
-    all_axes_dict = {}
-    hiddenzone_inputs_columns = hiddenzone_inputs.columns.difference(HIDDENZONE_TOPOLOGY_COLUMNS)
-    element_inputs_columns = element_inputs.columns.difference(ELEMENT_TOPOLOGY_COLUMNS)
-    root_inputs_columns = root_inputs.columns.difference(ROOT_TOPOLOGY_COLUMNS)
-    axis_inputs_columns = axis_inputs.columns.difference(AXIS_TOPOLOGY_COLUMNS)
-
-    for element_inputs_id, element_inputs_group in element_inputs.groupby(ELEMENT_TOPOLOGY_COLUMNS):
-        # element
-        element_inputs_series = element_inputs_group.loc[element_inputs_group.first_valid_index()]
-        element_inputs_dict = element_inputs_series[element_inputs_columns].to_dict()
-        all_element_dict[element_inputs_id] = element_inputs_dict
-
-    hiddenzone_inputs_grouped = hiddenzone_inputs.groupby(HIDDENZONE_TOPOLOGY_COLUMNS)
-    for hiddenzone_inputs_id, hiddenzone_inputs_group in hiddenzone_inputs_grouped:
-        # hiddenzone
-        hiddenzone_inputs_series = hiddenzone_inputs_group.loc[hiddenzone_inputs_group.first_valid_index()]
-        hiddenzone_inputs_dict = hiddenzone_inputs_series[hiddenzone_inputs_columns].to_dict()
-        all_hiddenzone_dict[hiddenzone_inputs_id] = hiddenzone_inputs_dict
-
-    for root_inputs_id, root_inputs_group in root_inputs.groupby(ROOT_TOPOLOGY_COLUMNS):
-        # root
-        root_inputs_series = root_inputs_group.loc[root_inputs_group.first_valid_index()]
-        root_inputs_dict = root_inputs_series[root_inputs_columns].to_dict()
-        all_root_dict[root_inputs_id] = root_inputs_dict
-
-    for axis_inputs_id, axis_inputs_group in axis_inputs.groupby(AXIS_TOPOLOGY_COLUMNS):
-        # axis
-        axis_inputs_series = axis_inputs_group.loc[axis_inputs_group.first_valid_index()]
-        axis_inputs_dict = axis_inputs_series[axis_inputs_columns].to_dict()
-        all_axes_dict[axis_inputs_id] = axis_inputs_dict
+    all_hiddenzone_dict = _dataframe_to_dict(hiddenzone_inputs, HIDDENZONE_TOPOLOGY_COLUMNS)
+    all_element_dict = _dataframe_to_dict(element_inputs, ELEMENT_TOPOLOGY_COLUMNS)
+    all_root_dict = _dataframe_to_dict(root_inputs, ROOT_TOPOLOGY_COLUMNS)
+    all_axes_dict = _dataframe_to_dict(axis_inputs, AXIS_TOPOLOGY_COLUMNS)
 
     return {'hiddenzone': all_hiddenzone_dict, 'elements': all_element_dict, 'roots': all_root_dict, 'axes': all_axes_dict}
 
@@ -87,16 +85,12 @@ def to_dataframes(data_dict):
     .. seealso:: see :attr:`simulation.Simulation.outputs` for the structure of Growth-Wheat outputs.
     """
     dataframes_dict = {}
-    for (current_key, current_topology_columns, current_outputs_names) in (('hiddenzone', HIDDENZONE_TOPOLOGY_COLUMNS, simulation.HIDDENZONE_OUTPUTS),
-                                                                           ('elements', ELEMENT_TOPOLOGY_COLUMNS, simulation.ELEMENT_OUTPUTS),
-                                                                           ('roots', ROOT_TOPOLOGY_COLUMNS, simulation.ROOT_OUTPUTS),
-                                                                           ('axes', AXIS_TOPOLOGY_COLUMNS, simulation.AXIS_OUTPUTS)):
+    for current_key, current_topology_columns, current_columns_sorted in OUTPUTS_DATAFRAMES_COLUMNS:
         current_data_dict = data_dict[current_key]
         current_ids_df = pd.DataFrame(current_data_dict.keys(), columns=current_topology_columns)
         current_data_df = pd.DataFrame(current_data_dict.values())
         current_df = pd.concat([current_ids_df, current_data_df], axis=1)
         current_df.sort_values(by=current_topology_columns, inplace=True)
-        current_columns_sorted = current_topology_columns + current_outputs_names
         current_df = current_df.reindex(current_columns_sorted, axis=1, copy=False)
         current_df.reset_index(drop=True, inplace=True)
         dataframes_dict[current_key] = current_df
@@ -18,6 +18,54 @@ from growthwheat import parameters
 """
 
 
+def refresh_parameters():
+    """
+    Read the parameters used by the equations of this module from :mod:`growthwheat.parameters`.
+    The parameters are cached at import, so this function must be called again after any update of :mod:`growthwheat.parameters`
+    (:class:`growthwheat.simulation.Simulation` does it at initialisation and at the start of each run).
+    """
+    global _C_MOLAR_MASS, _N_MOLAR_MASS, _HEXOSE_MOLAR_MASS_C_RATIO, _AMINO_ACIDS_MOLAR_MASS_N_RATIO, _ALPHA, _BETA, _RATIO_SUCROSE_MSTRUCT, _RATIO_AMINO_ACIDS_MSTRUCT, \
+        _AMINO_ACIDS_C_RATIO, _AMINO_ACIDS_N_RATIO, _RATIO_ENCLOSED_LEAF_INTERNODE, _INIT_CYTOKININS_EMERGED_TISSUE, _te, _te_IN, _conc_sucrose_offset, _VMAX_ROOTS_GROWTH_POSTFLO, \
+        _VMAX_ROOTS_GROWTH_PREFLO, _K_ROOTS_GROWTH, _N_ROOTS_GROWTH, _CONVERSION_MMOL_C_G_MSTRUCT_ROOTS, _RATIO_N_MSTRUCT_ROOTS_, _MINERAL_LIVING_TISSUE, _MINERAL_SENESCED_TISSUE, \
+        _K_ROOTS_GROWTH_POW_N, _CONVERSION_G_MSTRUCT_MMOL_N_ROOTS, _CONVERSION_MMOL_C_G_HEXOSES, _CONVERSION_MMOL_N_G_AMINO_ACIDS, \
+        _ALPHA_BETA, _BETA_MINUS_1, _RATIO_ENCLOSED_LEAF_INTERNODE_ALPHA_BETA
+    _C_MOLAR_MASS = parameters.C_MOLAR_MASS
+    _N_MOLAR_MASS = parameters.N_MOLAR_MASS
+    _HEXOSE_MOLAR_MASS_C_RATIO = parameters.HEXOSE_MOLAR_MASS_C_RATIO
+    _AMINO_ACIDS_MOLAR_MASS_N_RATIO = parameters.AMINO_ACIDS_MOLAR_MASS_N_RATIO
+    _ALPHA = parameters.ALPHA
+    _BETA = parameters.BETA
+    _RATIO_SUCROSE_MSTRUCT = parameters.RATIO_SUCROSE_MSTRUCT
+    _RATIO_AMINO_ACIDS_MSTRUCT = parameters.RATIO_AMINO_ACIDS_MSTRUCT
+    _AMINO_ACIDS_C_RATIO = parameters.AMINO_ACIDS_C_RATIO
+    _AMINO_ACIDS_N_RATIO = parameters.AMINO_ACIDS_N_RATIO
+    _RATIO_ENCLOSED_LEAF_INTERNODE = parameters.RATIO_ENCLOSED_LEAF_INTERNODE
+    _INIT_CYTOKININS_EMERGED_TISSUE = parameters.INIT_CYTOKININS_EMERGED_TISSUE
+    _te = parameters.te
+    _te_IN = parameters.te_IN
+    _conc_sucrose_offset = parameters.conc_sucrose_offset
+    _VMAX_ROOTS_GROWTH_POSTFLO = parameters.VMAX_ROOTS_GROWTH_POSTFLO
+    _VMAX_ROOTS_GROWTH_PREFLO = parameters.VMAX_ROOTS_GROWTH_PREFLO
+    _K_ROOTS_GROWTH = parameters.K_ROOTS_GROWTH
+    _N_ROOTS_GROWTH = parameters.N_ROOTS_GROWTH
+    _CONVERSION_MMOL_C_G_MSTRUCT_ROOTS = parameters.CONVERSION_MMOL_C_G_MSTRUCT_ROOTS
+    _RATIO_N_MSTRUCT_ROOTS_ = parameters.RATIO_N_MSTRUCT_ROOTS_
+    _MINERAL_LIVING_TISSUE = parameters.MINERAL_LIVING_TISSUE
+    _MINERAL_SENESCED_TISSUE = parameters.MINERAL_SENESCED_TISSUE
+
+    # Combinations of parameters
+    _ALPHA_BETA = _ALPHA * _BETA  #: Coefficient of the derivative of the relation between leaf mass and leaf length
+    _BETA_MINUS_1 = _BETA - 1  #: Exponent of the derivative of the relation between leaf mass and leaf length
+    _RATIO_ENCLOSED_LEAF_INTERNODE_ALPHA_BETA = _RATIO_ENCLOSED_LEAF_INTERNODE * _ALPHA * _BETA  #: Same coefficient for the internode
+    _CONVERSION_MMOL_C_G_HEXOSES = 1E-6 * _C_MOLAR_MASS / _HEXOSE_MOLAR_MASS_C_RATIO  #: Conversion of mol C of sucrose or fructans to g of dry mass
+    _CONVERSION_MMOL_N_G_AMINO_ACIDS = 1E-6 * _N_MOLAR_MASS / _AMINO_ACIDS_MOLAR_MASS_N_RATIO  #: Conversion of mol N of amino acids or proteins to g of dry mass
+    _K_ROOTS_GROWTH_POW_N = _K_ROOTS_GROWTH ** _N_ROOTS_GROWTH
+    _CONVERSION_G_MSTRUCT_MMOL_N_ROOTS = _RATIO_N_MSTRUCT_ROOTS_ / _N_MOLAR_MASS * 1E6  #: Conversion of root structural dry mass to mol N of Nstruct
+
+
+refresh_parameters()
+
+
 def calculate_ratio_mstruct_DM(mstruct, sucrose, fructans, amino_acids, proteins):
     """
     Ratio mstruct/dry matter (dimensionless)
@@ -31,12 +79,8 @@ def calculate_ratio_mstruct_DM(mstruct, sucrose, fructans, amino_acids, proteins
     :return: Ratio mstruct/dry matter (dimensionless)
     :rtype: float
     """
-    C_MOLAR_MASS = parameters.C_MOLAR_MASS
-    N_MOLAR_MASS = parameters.N_MOLAR_MASS
-    dry_mass = ((sucrose * 1E-6 * C_MOLAR_MASS) / parameters.HEXOSE_MOLAR_MASS_C_RATIO +
-                (fructans * 1E-6 * C_MOLAR_MASS) / parameters.HEXOSE_MOLAR_MASS_C_RATIO +
-                (amino_acids * 1E-6 * N_MOLAR_MASS) / parameters.AMINO_ACIDS_MOLAR_MASS_N_RATIO +
-                (proteins * 1E-6 * N_MOLAR_MASS) / parameters.AMINO_ACIDS_MOLAR_MASS_N_RATIO +
+    dry_mass = ((sucrose + fructans) * _CONVERSION_MMOL_C_G_HEXOSES +
+                (amino_acids + proteins) * _CONVERSION_MMOL_N_G_AMINO_ACIDS +
                 mstruct)
 
     return mstruct / dry_mass
@@ -54,7 +98,7 @@ def calculate_delta_leaf_enclosed_mstruct(leaf_L, delta_leaf_L, ratio_mstruct_DM
     :return: delta_leaf_enclosed_mstruct (g)
     :rtype: float
     """
-    return parameters.ALPHA * parameters.BETA * leaf_L ** (parameters.BETA - 1) * delta_leaf_L * ratio_mstruct_DM
+    return _ALPHA_BETA * leaf_L ** _BETA_MINUS_1 * delta_leaf_L * ratio_mstruct_DM
 
 
 def calculate_delta_leaf_enclosed_mstruct_postE(delta_leaf_pseudo_age, leaf_pseudo_age, leaf_pseudostem_L, enclosed_mstruct, LSSW):
@@ -73,8 +117,8 @@ def calculate_delta_leaf_enclosed_mstruct_postE(delta_leaf_pseudo_age, leaf_pseu
     """
     enclosed_mstruct_max = leaf_pseudostem_L * LSSW
 
-    if leaf_pseudo_age < parameters.te:
-        delta_enclosed_mstruct = (enclosed_mstruct_max - enclosed_mstruct) / (parameters.te - leaf_pseudo_age) * delta_leaf_pseudo_age
+    if leaf_pseudo_age < _te:
+        delta_enclosed_mstruct = (enclosed_mstruct_max - enclosed_mstruct) / (_te - leaf_pseudo_age) * delta_leaf_pseudo_age
     else:
         delta_enclosed_mstruct = 0
 
@@ -94,7 +138,7 @@ def calculate_delta_internode_enclosed_mstruct(internode_L, delta_internode_L, r
     :return: delta_enclosed_internode_mstruct (g)
     :rtype: float
     """
-    return parameters.RATIO_ENCLOSED_LEAF_INTERNODE * parameters.ALPHA * parameters.BETA * internode_L ** (parameters.BETA - 1) * delta_internode_L * ratio_mstruct_DM
+    return _RATIO_ENCLOSED_LEAF_INTERNODE_ALPHA_BETA * internode_L ** _BETA_MINUS_1 * delta_internode_L * ratio_mstruct_DM
 
 
 def calculate_delta_internode_enclosed_mstruct_postL(delta_internode_pseudo_age, internode_pseudo_age, internode_L, internode_pseudostem_L, internode_Lmax, LSIW, enclosed_mstruct):
@@ -118,8 +162,8 @@ def calculate_delta_internode_enclosed_mstruct_postL(delta_internode_pseudo_age,
     else:
         enclosed_mstruct_max = min(internode_pseudostem_L, internode_Lmax) * LSIW
 
-    if internode_pseudo_age < parameters.te_IN:
-        delta_enclosed_mstruct = (enclosed_mstruct_max - enclosed_mstruct) / (parameters.te_IN - internode_pseudo_age) * delta_internode_pseudo_age
+    if internode_pseudo_age < _te_IN:
+        delta_enclosed_mstruct = (enclosed_mstruct_max - enclosed_mstruct) / (_te_IN - internode_pseudo_age) * delta_internode_pseudo_age
     else:
         delta_enclosed_mstruct = 0
 
@@ -136,9 +180,24 @@ def calculate_delta_emerged_tissue_mstruct(SW, previous_mstruct, metric):
     :return: delta mstruct (g)
     :rtype: float
     """
-    updated_mstruct = SW * metric
-    delta_mstruct = updated_mstruct - previous_mstruct
-    return max(0., delta_mstruct)
+    return calculate_delta_emerged_tissue_mstruct_Nstruct(SW, previous_mstruct, metric)[0]
+
+
+def calculate_delta_emerged_tissue_mstruct_Nstruct(SW, previous_mstruct, metric):
+    """ delta mstruct and delta Nstruct of emerged tissue (lamina, sheath and internode).
+    Fusion of :func:`calculate_delta_emerged_tissue_mstruct` and :func:`calculate_delta_Nstruct`.
+
+    :param float SW: For Lamina : Structural Specific Weight (g m-2); For sheath and internode : Lineic Structural Weight (g m-1)
+    :param float previous_mstruct: mstruct at the previous time step i.e. not yet updated (g)
+    :param float metric: For Lamina : Area at the current time step, as updated by the geometrical model (m2); For sheath and internode : Length at the current time step (m)
+
+    :return: delta mstruct (g), delta Nstruct (g)
+    :rtype: (float, float)
+    """
+    delta_mstruct = SW * metric - previous_mstruct
+    if delta_mstruct > 0.:
+        return delta_mstruct, delta_mstruct * _RATIO_AMINO_ACIDS_MSTRUCT
+    return 0., 0.
 
 
 def calculate_delta_Nstruct(delta_mstruct):
@@ -149,7 +208,7 @@ def calculate_delta_Nstruct(delta_mstruct):
     :return: delta Nstruct (g)
     :rtype: float
     """
-    return delta_mstruct * parameters.RATIO_AMINO_ACIDS_MSTRUCT
+    return delta_mstruct * _RATIO_AMINO_ACIDS_MSTRUCT
 
 
 def calculate_export(delta_mstruct, metabolite, hiddenzone_mstruct):
@@ -162,7 +221,10 @@ def calculate_export(delta_mstruct, metabolite, hiddenzone_mstruct):
     :return: metabolite export (mol N)
     :rtype: float
     """
-    return delta_mstruct * max(0., (metabolite / hiddenzone_mstruct))
+    metabolite_concentration = metabolite / hiddenzone_mstruct
+    if metabolite_concentration > 0.:
+        return delta_mstruct * metabolite_concentration
+    return delta_mstruct * 0.  # keeps NaN and inf deltas visible, as delta_mstruct * max(0., metabolite_concentration) did
 
 
 def calculate_init_cytokinins_emerged_tissue(delta_mstruct):
@@ -173,7 +235,7 @@ def calculate_init_cytokinins_emerged_tissue(delta_mstruct):
     :return: cytokinins addition (AU)
     :rtype: float
     """
-    return delta_mstruct * parameters.INIT_CYTOKININS_EMERGED_TISSUE  # TODO: Set according to protein concentration ?
+    return delta_mstruct * _INIT_CYTOKININS_EMERGED_TISSUE  # TODO: Set according to protein concentration ?
 
 
 def calculate_s_Nstruct_amino_acids(delta_hiddenzone_Nstruct, delta_lamina_Nstruct, delta_sheath_Nstruct, delta_internode_Nstruct):
@@ -187,7 +249,24 @@ def calculate_s_Nstruct_amino_acids(delta_hiddenzone_Nstruct, delta_lamina_Nstru
     :return: Amino acid consumption (mol N)
     :rtype: float
     """
-    return (delta_hiddenzone_Nstruct + delta_lamina_Nstruct + delta_sheath_Nstruct + delta_internode_Nstruct) / parameters.N_MOLAR_MASS * 1E6
+    return calculate_s_mstruct_sucrose_amino_acids(0., delta_hiddenzone_Nstruct + delta_lamina_Nstruct + delta_sheath_Nstruct + delta_internode_Nstruct)[1]
+
+
+def _calculate_s_mstruct_sucrose(delta_mstruct, s_Nstruct_amino_acids_N):
+    """Consumption of sucrose for the calculated mstruct growth (mol C consumed by mstruct growth)
+
+    :param float delta_mstruct: Total mstruct growth (g)
+    :param float s_Nstruct_amino_acids_N: Total amino acid consumption (mol N) due to Nstruct (mol N)
+
+    :return: Sucrose consumption (mol C)
+    :rtype: float
+    """
+    s_Nstruct_amino_acids = s_Nstruct_amino_acids_N / _AMINO_ACIDS_N_RATIO  #: mol of AA
+    s_mstruct_amino_acids_C = s_Nstruct_amino_acids * _AMINO_ACIDS_C_RATIO  #: mol of C coming from AA
+    s_mstruct_C = delta_mstruct * _RATIO_SUCROSE_MSTRUCT / _C_MOLAR_MASS * 1E6  #: Total C used for mstruct growth (mol C)
+    s_mstruct_sucrose_C = s_mstruct_C - s_mstruct_amino_acids_C  #: mol of C coming from sucrose
+
+    return s_mstruct_sucrose_C
 
 
 def calculate_s_mstruct_sucrose(delta_hiddenzone_mstruct, delta_lamina_mstruct, delta_sheath_mstruct, s_Nstruct_amino_acids_N):
@@ -201,12 +280,22 @@ def calculate_s_mstruct_sucrose(delta_hiddenzone_mstruct, delta_lamina_mstruct,
     :return: Sucrose consumption (mol C)
     :rtype: float
     """
-    s_Nstruct_amino_acids = s_Nstruct_amino_acids_N / parameters.AMINO_ACIDS_N_RATIO  #: mol of AA
-    s_mstruct_amino_acids_C = s_Nstruct_amino_acids * parameters.AMINO_ACIDS_C_RATIO  #: mol of C coming from AA
-    s_mstruct_C = (delta_hiddenzone_mstruct + delta_lamina_mstruct + delta_sheath_mstruct) * parameters.RATIO_SUCROSE_MSTRUCT / parameters.C_MOLAR_MASS * 1E6  #: Total C used for mstruct growth (mol C)
-    s_mstruct_sucrose_C = s_mstruct_C - s_mstruct_amino_acids_C  #: mol of C coming from sucrose
+    return _calculate_s_mstruct_sucrose(delta_hiddenzone_mstruct + delta_lamina_mstruct + delta_sheath_mstruct, s_Nstruct_amino_acids_N)
 
-    return s_mstruct_sucrose_C
+
+def calculate_s_mstruct_sucrose_amino_acids(delta_mstruct, delta_Nstruct):
+    """Consumption of sucrose and of amino acids for the calculated mstruct and Nstruct growth (mol C and mol N consumed by mstruct growth).
+    Fusion of :func:`calculate_s_mstruct_sucrose` and :func:`calculate_s_Nstruct_amino_acids`.
+
+    :param float delta_mstruct: Total mstruct growth of the hidden zone, the lamina and the sheath (g)
+    :param float delta_Nstruct: Total Nstruct growth of the hidden zone, the lamina, the sheath and the internode (g)
+
+    :return: Sucrose consumption (mol C), Amino acid consumption (mol N)
+    :rtype: (float, float)
+    """
+    s_Nstruct_amino_acids_N = delta_Nstruct / _N_MOLAR_MASS * 1E6  #: mol of N
+
+    return _calculate_s_mstruct_sucrose(delta_mstruct, s_Nstruct_amino_acids_N), s_Nstruct_amino_acids_N
 
 
 def calculate_sheath_mstruct(sheath_L, LSSW):
@@ -234,22 +323,27 @@ def calculate_roots_mstruct_growth(sucrose, amino_acids, mstruct, delta_teq, pos
     :return: mstruct_C_growth (mol C), mstruct_growth (g), Nstruct_growth (g), Nstruct_N_growth (mol N)
     :rtype: (float, float, float, float)
     """
-    conc_sucrose_effective = max(0., sucrose / mstruct - parameters.conc_sucrose_offset)
+    # Called for each root at each time step: the bounds are applied with comparisons rather than with the min and max builtins, which are slower on scalars.
+    conc_sucrose_effective = sucrose / mstruct - _conc_sucrose_offset
 
     if postflowering_stages:
-        Vmax = parameters.VMAX_ROOTS_GROWTH_POSTFLO
+        Vmax = _VMAX_ROOTS_GROWTH_POSTFLO
     else:
-        Vmax = parameters.VMAX_ROOTS_GROWTH_PREFLO
-    N = parameters.N_ROOTS_GROWTH
+        Vmax = _VMAX_ROOTS_GROWTH_PREFLO
 
     if conc_sucrose_effective > 0.:
-        mstruct_C_growth = max(0., ((conc_sucrose_effective ** N) * Vmax) / ((conc_sucrose_effective ** N) + (parameters.K_ROOTS_GROWTH ** N)) * delta_teq * mstruct)  #: root growth in C (mol of C)
+        conc_sucrose_effective_pow_N = conc_sucrose_effective ** _N_ROOTS_GROWTH
+        mstruct_C_growth = (conc_sucrose_effective_pow_N * Vmax) / (conc_sucrose_effective_pow_N + _K_ROOTS_GROWTH_POW_N) * delta_teq * mstruct  #: root growth in C (mol of C)
+        if not mstruct_C_growth > 0.:
+            mstruct_C_growth = 0.
     else:
         mstruct_C_growth = 0.
-    mstruct_growth = mstruct_C_growth * parameters.CONVERSION_MMOL_C_G_MSTRUCT_ROOTS  #: root growth (g of structural dry mass)
+    mstruct_growth = mstruct_C_growth * _CONVERSION_MMOL_C_G_MSTRUCT_ROOTS  #: root growth (g of structural dry mass)
 
-    Nstruct_growth = mstruct_growth * parameters.RATIO_N_MSTRUCT_ROOTS_  #: root growth in N (g of structural dry mass)
-    Nstruct_N_growth = min(amino_acids, (Nstruct_growth / parameters.N_MOLAR_MASS) * 1E6)  #: root growth in nitrogen (mol N)
+    Nstruct_growth = mstruct_growth * _RATIO_N_MSTRUCT_ROOTS_  #: root growth in N (g of structural dry mass)
+    Nstruct_N_growth = mstruct_growth * _CONVERSION_G_MSTRUCT_MMOL_N_ROOTS  #: root growth in nitrogen (mol N)
+    if not Nstruct_N_growth < amino_acids:
+        Nstruct_N_growth = amino_acids
 
     return mstruct_C_growth, mstruct_growth, Nstruct_growth, Nstruct_N_growth
 
@@ -263,9 +357,9 @@ def calculate_roots_s_mstruct_sucrose(delta_roots_mstruct, s_Nstruct_amino_acids
     :return: Sucrose consumption (mol C)
     :rtype: float
     """
-    s_Nstruct_amino_acids = s_Nstruct_amino_acids_N / parameters.AMINO_ACIDS_N_RATIO  #: mol of AA
-    s_mstruct_amino_acids_C = s_Nstruct_amino_acids * parameters.AMINO_ACIDS_C_RATIO  #: mol of C coming from AA
-    s_mstruct_C = delta_roots_mstruct * parameters.RATIO_SUCROSE_MSTRUCT / parameters.C_MOLAR_MASS * 1E6  #: Total C used for mstruct growth (mol C)
+    s_Nstruct_amino_acids = s_Nstruct_amino_acids_N / _AMINO_ACIDS_N_RATIO  #: mol of AA
+    s_mstruct_amino_acids_C = s_Nstruct_amino_acids * _AMINO_ACIDS_C_RATIO  #: mol of C coming from AA
+    s_mstruct_C = delta_roots_mstruct * _RATIO_SUCROSE_MSTRUCT / _C_MOLAR_MASS * 1E6  #: Total C used for mstruct growth (mol C)
     s_mstruct_sucrose_C = s_mstruct_C - s_mstruct_amino_acids_C  #: mol of coming from sucrose
 
     return s_mstruct_sucrose_C
@@ -280,5 +374,5 @@ def calculate_mineral_plant(mstruct, senesced_mstruct):
     :return: Mineral mass of the plant (g)
     :rtype: float
     """
-    mineral_plant = (mstruct * parameters.MINERAL_LIVING_TISSUE) + (senesced_mstruct * parameters.MINERAL_SENESCED_TISSUE)
+    mineral_plant = (mstruct * _MINERAL_LIVING_TISSUE) + (senesced_mstruct * _MINERAL_SENESCED_TISSUE)
     return mineral_plant
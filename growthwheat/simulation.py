@@ -2,8 +2,6 @@
 
 from __future__ import division  # use "//" to do integer division
 
-import copy
-
 from growthwheat import model
 from growthwheat import parameters
 
@@ -85,6 +83,7 @@ class Simulation(object):
         #: Update parameters if specified
         if update_parameters:
             parameters.__dict__.update(update_parameters)
+        model.refresh_parameters()
 
     def initialize(self, inputs):
         """
@@ -101,8 +100,12 @@ class Simulation(object):
 
         :param bool postflowering_stages: if True the model will calculate root growth with the parameters calibrated for post flowering stages
         """
-        # Copy the inputs into the output dict
-        self.outputs.update({inputs_type: copy.deepcopy(all_inputs) for inputs_type, all_inputs in self.inputs.items() if inputs_type in {'hiddenzone', 'elements', 'roots', 'axes'}})
+        # Read the current values of the parameters, which may have been updated since the last run
+        model.refresh_parameters()
+
+        # Copy the inputs into the output dict. The inputs of each organ are scalars, so a shallow copy of each organ dict is enough.
+        self.outputs.update({inputs_type: {organ_id: organ_inputs.copy() for organ_id, organ_inputs in all_inputs.items()}
+                             for inputs_type, all_inputs in self.inputs.items() if inputs_type in {'hiddenzone', 'elements', 'roots', 'axes'}})
 
         # Hidden growing zones
         all_hiddenzone_inputs = self.inputs['hiddenzone']
@@ -118,11 +121,12 @@ class Simulation(object):
 
         # axes
         all_axes_inputs = self.inputs['axes']
-        all_axes_outputs = self.outputs['axes']
 
         # ----------------------------------------------
         # ----------- Hiddenzones and elements ---------
         # ----------------------------------------------
+        internode_rapid_growth_t = parameters.internode_rapid_growth_t
+
         for hiddenzone_id, hiddenzone_inputs in sorted(all_hiddenzone_inputs.items()):
 
             curr_hiddenzone_outputs = all_hiddenzone_outputs[hiddenzone_id]
@@ -135,23 +139,35 @@ class Simulation(object):
             #: Main stem
             else:
                 # Initialisation of the exports towards the growing lamina or sheath
-                delta_leaf_enclosed_mstruct = delta_leaf_enclosed_Nstruct = delta_lamina_mstruct = delta_sheath_mstruct = delta_lamina_Nstruct = delta_sheath_Nstruct = leaf_export_sucrose = \
+                delta_leaf_enclosed_mstruct = delta_leaf_enclosed_Nstruct = delta_emerged_leaf_mstruct = delta_emerged_leaf_Nstruct = leaf_export_sucrose = \
                     delta_internode_mstruct = delta_internode_Nstruct = leaf_export_amino_acids = leaf_remob_fructan = leaf_export_proteins = internode_export_sucrose = \
                     internode_export_amino_acids = internode_remob_fructan = internode_export_proteins = 0.
 
+                # Hiddenzone inputs used several times
+                hiddenzone_mstruct = hiddenzone_inputs['mstruct']
+                hiddenzone_sucrose = hiddenzone_inputs['sucrose']
+                hiddenzone_amino_acids = hiddenzone_inputs['amino_acids']
+                hiddenzone_fructan = hiddenzone_inputs['fructan']
+                hiddenzone_proteins = hiddenzone_inputs['proteins']
+                internode_pseudo_age = hiddenzone_inputs['internode_pseudo_age']
+                leaf_is_emerged = hiddenzone_inputs['leaf_is_emerged']
+
+                # Ratio mstruct/dry matter of the hiddenzone, shared by the growth of the enclosed internode and of the enclosed leaf
+                internode_is_before_rapid_growth = internode_pseudo_age < internode_rapid_growth_t
+                if internode_is_before_rapid_growth or not leaf_is_emerged:
+                    ratio_mstruct_DM = model.calculate_ratio_mstruct_DM(hiddenzone_mstruct, hiddenzone_sucrose, hiddenzone_fructan, hiddenzone_amino_acids, hiddenzone_proteins)
+
                 # -- Delta Growth internode
 
-                if hiddenzone_inputs['internode_pseudo_age'] < parameters.internode_rapid_growth_t:  #: Internode is not yet in rapide growth stage TODO : tester sur une variable "is_ligulated"
+                if internode_is_before_rapid_growth:  #: Internode is not yet in rapide growth stage TODO : tester sur une variable "is_ligulated"
                     # delta mstruct of the internode
-                    ratio_mstruct_DM = model.calculate_ratio_mstruct_DM(hiddenzone_inputs['mstruct'], hiddenzone_inputs['sucrose'], hiddenzone_inputs['fructan'],
-                                                                        hiddenzone_inputs['amino_acids'], hiddenzone_inputs['proteins'])
                     delta_internode_enclosed_mstruct = model.calculate_delta_internode_enclosed_mstruct(hiddenzone_inputs['internode_L'], hiddenzone_inputs['delta_internode_L'], ratio_mstruct_DM)
                     # delta Nstruct of the internode
                     delta_internode_enclosed_Nstruct = model.calculate_delta_Nstruct(delta_internode_enclosed_mstruct)
                 else:
                     # delta mstruct of the enclosed internode
                     delta_internode_enclosed_mstruct = model.calculate_delta_internode_enclosed_mstruct_postL(hiddenzone_inputs['delta_internode_pseudo_age'],
-                                                                                                              hiddenzone_inputs['internode_pseudo_age'],
+                                                                                                              internode_pseudo_age,
                                                                                                               hiddenzone_inputs['internode_L'],
                                                                                                               hiddenzone_inputs['internode_distance_to_emerge'],
                                                                                                               hiddenzone_inputs['internode_Lmax'],
@@ -161,19 +177,18 @@ class Simulation(object):
                     delta_internode_enclosed_Nstruct = model.calculate_delta_Nstruct(delta_internode_enclosed_mstruct)
 
                 if hiddenzone_inputs['internode_is_visible']:  #: Internode is visible
-                    visible_internode_id = hiddenzone_id + tuple(['internode', 'StemElement'])
+                    visible_internode_id = hiddenzone_id + ('internode', 'StemElement')
                     curr_visible_internode_inputs = all_elements_inputs[visible_internode_id]
                     curr_visible_internode_outputs = all_elements_outputs[visible_internode_id]
-                    # Delta mstruct of the emerged internode
-                    delta_internode_mstruct = model.calculate_delta_emerged_tissue_mstruct(hiddenzone_inputs['LSIW'], curr_visible_internode_inputs['mstruct'], curr_visible_internode_inputs['length'])
-                    # Delta Nstruct of the emerged internode
-                    delta_internode_Nstruct = model.calculate_delta_Nstruct(delta_internode_mstruct)
+                    # Delta mstruct and delta Nstruct of the emerged internode
+                    delta_internode_mstruct, delta_internode_Nstruct = model.calculate_delta_emerged_tissue_mstruct_Nstruct(hiddenzone_inputs['LSIW'], curr_visible_internode_inputs['mstruct'],
+                                                                                                                             curr_visible_internode_inputs['length'])
                     # Export of sucrose from hiddenzone towards emerged internode
-                    internode_export_sucrose = model.calculate_export(delta_internode_mstruct, hiddenzone_inputs['sucrose'], hiddenzone_inputs['mstruct'])
+                    internode_export_sucrose = model.calculate_export(delta_internode_mstruct, hiddenzone_sucrose, hiddenzone_mstruct)
                     # Export of amino acids from hiddenzone towards emerged internode
-                    internode_export_amino_acids = model.calculate_export(delta_internode_mstruct, hiddenzone_inputs['amino_acids'], hiddenzone_inputs['mstruct'])
-                    internode_remob_fructan = model.calculate_export(delta_internode_mstruct, hiddenzone_inputs['fructan'], hiddenzone_inputs['mstruct'])
-                    internode_export_proteins = model.calculate_export(delta_internode_mstruct, hiddenzone_inputs['proteins'], hiddenzone_inputs['mstruct'])
+                    internode_export_amino_acids = model.calculate_export(delta_internode_mstruct, hiddenzone_amino_acids, hiddenzone_mstruct)
+                    internode_remob_fructan = model.calculate_export(delta_internode_mstruct, hiddenzone_fructan, hiddenzone_mstruct)
+                    internode_export_proteins = model.calculate_export(delta_internode_mstruct, hiddenzone_proteins, hiddenzone_mstruct)
 
                     # Update of internode outputs
                     curr_visible_internode_outputs['mstruct'] += delta_internode_mstruct
@@ -182,13 +197,10 @@ class Simulation(object):
                     curr_visible_internode_outputs['sucrose'] += internode_export_sucrose + internode_remob_fructan
                     curr_visible_internode_outputs['amino_acids'] += internode_export_amino_acids
                     curr_visible_internode_outputs['proteins'] += internode_export_proteins
-                    self.outputs['elements'][visible_internode_id] = curr_visible_internode_outputs
 
                 # -- Delta Growth leaf
-                if not hiddenzone_inputs['leaf_is_emerged']:  #: Leaf is not emerged
+                if not leaf_is_emerged:  #: Leaf is not emerged
                     # delta mstruct of the hidden leaf
-                    ratio_mstruct_DM = model.calculate_ratio_mstruct_DM(hiddenzone_inputs['mstruct'], hiddenzone_inputs['sucrose'], hiddenzone_inputs['fructan'],
-                                                                        hiddenzone_inputs['amino_acids'], hiddenzone_inputs['proteins'])
                     delta_leaf_enclosed_mstruct = model.calculate_delta_leaf_enclosed_mstruct(hiddenzone_inputs['leaf_L'], hiddenzone_inputs['delta_leaf_L'], ratio_mstruct_DM)
                     # delta Nstruct of the hidden leaf
                     delta_leaf_enclosed_Nstruct = model.calculate_delta_Nstruct(delta_leaf_enclosed_mstruct)
@@ -202,71 +214,46 @@ class Simulation(object):
                     # delta Nstruct of the enclosed en leaf
                     delta_leaf_enclosed_Nstruct = model.calculate_delta_Nstruct(delta_leaf_enclosed_mstruct)
 
-                    # leaf has emerged and still growing
-                    visible_lamina_id = hiddenzone_id + tuple(['blade', 'LeafElement1'])
-                    #: Lamina is growing
-                    if all_elements_inputs[visible_lamina_id]['is_growing']:
-                        curr_visible_lamina_inputs = all_elements_inputs[visible_lamina_id]
-                        curr_visible_lamina_outputs = all_elements_outputs[visible_lamina_id]
-                        # Delta mstruct of the emerged lamina
-                        delta_lamina_mstruct = model.calculate_delta_emerged_tissue_mstruct(hiddenzone_inputs['SSLW'], curr_visible_lamina_inputs['mstruct'], curr_visible_lamina_inputs['green_area'])
-                        # Delta Nstruct of the emerged lamina
-                        delta_lamina_Nstruct = model.calculate_delta_Nstruct(delta_lamina_mstruct)
-                        # Export of metabolite from hiddenzone towards emerged lamina
-                        leaf_export_sucrose = model.calculate_export(delta_lamina_mstruct, hiddenzone_inputs['sucrose'], hiddenzone_inputs['mstruct'])
-                        leaf_export_amino_acids = model.calculate_export(delta_lamina_mstruct, hiddenzone_inputs['amino_acids'], hiddenzone_inputs['mstruct'])
-                        leaf_remob_fructan = model.calculate_export(delta_lamina_mstruct, hiddenzone_inputs['fructan'], hiddenzone_inputs['mstruct'])
-                        leaf_export_proteins = model.calculate_export(delta_lamina_mstruct, hiddenzone_inputs['proteins'], hiddenzone_inputs['mstruct'])
-                        # Cytokinins in the newly visible mstruct
-                        addition_cytokinins = model.calculate_init_cytokinins_emerged_tissue(delta_lamina_mstruct)
-
-                        # Update of lamina outputs
-                        curr_visible_lamina_outputs['mstruct'] += delta_lamina_mstruct
-                        curr_visible_lamina_outputs['max_mstruct'] = curr_visible_lamina_outputs['mstruct']
-                        curr_visible_lamina_outputs['Nstruct'] += delta_lamina_Nstruct
-                        curr_visible_lamina_outputs['sucrose'] += leaf_export_sucrose + leaf_remob_fructan
-                        curr_visible_lamina_outputs['amino_acids'] += leaf_export_amino_acids
-                        curr_visible_lamina_outputs['proteins'] += leaf_export_proteins
-                        curr_visible_lamina_outputs['cytokinins'] += addition_cytokinins
-
-                        self.outputs['elements'][visible_lamina_id] = curr_visible_lamina_outputs
-
+                    # leaf has emerged and still growing : the growing emerged organ is the lamina, then the sheath once the lamina is mature
+                    visible_lamina_id = hiddenzone_id + ('blade', 'LeafElement1')
+                    curr_visible_lamina_inputs = all_elements_inputs[visible_lamina_id]
+                    if curr_visible_lamina_inputs['is_growing']:  #: Lamina is growing
+                        visible_organ_id = visible_lamina_id
+                        curr_visible_organ_inputs = curr_visible_lamina_inputs
+                        organ_SW = hiddenzone_inputs['SSLW']
+                        organ_metric = curr_visible_organ_inputs['green_area']
                     else:  #: Mature lamina, growing sheath
                         # The hidden part of the sheath is only updated once, at the end of leaf elongation, by remobilisation from the hiddenzone
-                        visible_sheath_id = hiddenzone_id + tuple(['sheath', 'StemElement'])
-                        curr_visible_sheath_inputs = all_elements_inputs[visible_sheath_id]
-                        curr_visible_sheath_outputs = all_elements_outputs[visible_sheath_id]
-                        # Delta mstruct of the emerged sheath
-                        delta_sheath_mstruct = model.calculate_delta_emerged_tissue_mstruct(hiddenzone_inputs['LSSW'], curr_visible_sheath_inputs['mstruct'], curr_visible_sheath_inputs['length'])
-                        # Delta Nstruct of the emerged sheath
-                        delta_sheath_Nstruct = model.calculate_delta_Nstruct(delta_sheath_mstruct)
-                        # Export of metabolite from hiddenzone towards emerged sheath
-                        leaf_export_sucrose = model.calculate_export(delta_sheath_mstruct, hiddenzone_inputs['sucrose'], hiddenzone_inputs['mstruct'])
-                        leaf_export_amino_acids = model.calculate_export(delta_sheath_mstruct, hiddenzone_inputs['amino_acids'], hiddenzone_inputs['mstruct'])
-                        leaf_remob_fructan = model.calculate_export(delta_sheath_mstruct, hiddenzone_inputs['fructan'], hiddenzone_inputs['mstruct'])
-                        leaf_export_proteins = model.calculate_export(delta_sheath_mstruct, hiddenzone_inputs['proteins'], hiddenzone_inputs['mstruct'])
-                        addition_cytokinins = model.calculate_init_cytokinins_emerged_tissue(delta_sheath_mstruct)
-
-                        # Update of sheath outputs
-                        curr_visible_sheath_outputs['mstruct'] += delta_sheath_mstruct
-                        curr_visible_sheath_outputs['max_mstruct'] = curr_visible_sheath_outputs['mstruct']
-                        curr_visible_sheath_outputs['Nstruct'] += delta_sheath_Nstruct
-                        curr_visible_sheath_outputs['sucrose'] += leaf_export_sucrose + leaf_remob_fructan
-                        curr_visible_sheath_outputs['amino_acids'] += leaf_export_amino_acids
-                        curr_visible_sheath_outputs['proteins'] += leaf_export_proteins
-                        curr_visible_sheath_outputs['cytokinins'] += addition_cytokinins
-                        self.outputs['elements'][visible_sheath_id] = curr_visible_sheath_outputs
+                        visible_organ_id = hiddenzone_id + ('sheath', 'StemElement')
+                        curr_visible_organ_inputs = all_elements_inputs[visible_organ_id]
+                        organ_SW = hiddenzone_inputs['LSSW']
+                        organ_metric = curr_visible_organ_inputs['length']
+                    curr_visible_organ_outputs = all_elements_outputs[visible_organ_id]
+
+                    # Delta mstruct and delta Nstruct of the emerged lamina or sheath
+                    delta_emerged_leaf_mstruct, delta_emerged_leaf_Nstruct = model.calculate_delta_emerged_tissue_mstruct_Nstruct(organ_SW, curr_visible_organ_inputs['mstruct'], organ_metric)
+                    # Export of metabolite from hiddenzone towards emerged lamina or sheath
+                    leaf_export_sucrose = model.calculate_export(delta_emerged_leaf_mstruct, hiddenzone_sucrose, hiddenzone_mstruct)
+                    leaf_export_amino_acids = model.calculate_export(delta_emerged_leaf_mstruct, hiddenzone_amino_acids, hiddenzone_mstruct)
+                    leaf_remob_fructan = model.calculate_export(delta_emerged_leaf_mstruct, hiddenzone_fructan, hiddenzone_mstruct)
+                    leaf_export_proteins = model.calculate_export(delta_emerged_leaf_mstruct, hiddenzone_proteins, hiddenzone_mstruct)
+                    # Cytokinins in the newly visible mstruct
+                    addition_cytokinins = model.calculate_init_cytokinins_emerged_tissue(delta_emerged_leaf_mstruct)
+
+                    # Update of lamina or sheath outputs
+                    curr_visible_organ_outputs['mstruct'] += delta_emerged_leaf_mstruct
+                    curr_visible_organ_outputs['max_mstruct'] = curr_visible_organ_outputs['mstruct']
+                    curr_visible_organ_outputs['Nstruct'] += delta_emerged_leaf_Nstruct
+                    curr_visible_organ_outputs['sucrose'] += leaf_export_sucrose + leaf_remob_fructan
+                    curr_visible_organ_outputs['amino_acids'] += leaf_export_amino_acids
+                    curr_visible_organ_outputs['proteins'] += leaf_export_proteins
+                    curr_visible_organ_outputs['cytokinins'] += addition_cytokinins
 
                 # -- CN consumption due to mstruct/Nstruct growth of the enclosed leaf and of the internode
-                curr_hiddenzone_outputs['AA_consumption_mstruct'] = model.calculate_s_Nstruct_amino_acids((delta_leaf_enclosed_Nstruct + delta_internode_enclosed_Nstruct),
-                                                                                                          delta_lamina_Nstruct,
-                                                                                                          delta_sheath_Nstruct,
-                                                                                                          delta_internode_Nstruct)  #: Consumption of amino acids due to mstruct growth (mol N)
-                curr_hiddenzone_outputs['sucrose_consumption_mstruct'] = model.calculate_s_mstruct_sucrose((delta_leaf_enclosed_mstruct + delta_internode_enclosed_mstruct),
-                                                                                                           delta_lamina_mstruct,
-                                                                                                           delta_sheath_mstruct,
-                                                                                                           curr_hiddenzone_outputs[
-                                                                                                               'AA_consumption_mstruct'])  #: Consumption of sucrose due to mstruct growth (mol C)
+                curr_hiddenzone_outputs['sucrose_consumption_mstruct'], curr_hiddenzone_outputs['AA_consumption_mstruct'] = \
+                    model.calculate_s_mstruct_sucrose_amino_acids((delta_leaf_enclosed_mstruct + delta_internode_enclosed_mstruct) + delta_emerged_leaf_mstruct,
+                                                                  (delta_leaf_enclosed_Nstruct + delta_internode_enclosed_Nstruct) + delta_emerged_leaf_Nstruct +
+                                                                  delta_internode_Nstruct)  #: Consumption of sucrose (mol C) and of amino acids (mol N) due to mstruct growth
                 curr_hiddenzone_outputs['Respi_growth'] = RespirationModel.R_growth(curr_hiddenzone_outputs['sucrose_consumption_mstruct'])  #: Respiration growth (mol C)
 
                 # -- Update of hiddenzone outputs
@@ -281,7 +268,6 @@ class Simulation(object):
                 curr_hiddenzone_outputs['fructan'] -= (leaf_remob_fructan + internode_remob_fructan)
                 curr_hiddenzone_outputs['amino_acids'] -= (curr_hiddenzone_outputs['AA_consumption_mstruct'] + leaf_export_amino_acids + internode_export_amino_acids)
                 curr_hiddenzone_outputs['proteins'] -= (leaf_export_proteins + internode_export_proteins)
-                self.outputs['hiddenzone'][hiddenzone_id] = curr_hiddenzone_outputs
 
                 # -- Remobilisation at the end of leaf elongation
                 if hiddenzone_inputs['leaf_is_remobilizing']:
@@ -295,11 +281,11 @@ class Simulation(object):
                         share_hidden_sheath = 1
 
                     # Add to hidden part of the sheath
-                    hidden_sheath_id = hiddenzone_id + tuple(['sheath', 'HiddenElement'])
-                    if hidden_sheath_id not in self.outputs['elements'].keys():
+                    hidden_sheath_id = hiddenzone_id + ('sheath', 'HiddenElement')
+                    if hidden_sheath_id not in all_elements_outputs:
                         new_sheath_outputs = parameters.OrganInit().__dict__
-                        self.outputs['elements'][hidden_sheath_id] = new_sheath_outputs
-                    curr_hidden_sheath_outputs = self.outputs['elements'][hidden_sheath_id]
+                        all_elements_outputs[hidden_sheath_id] = new_sheath_outputs
+                    curr_hidden_sheath_outputs = all_elements_outputs[hidden_sheath_id]
                     curr_hidden_sheath_outputs['mstruct'] = curr_hiddenzone_outputs['leaf_enclosed_mstruct'] * share_hidden_sheath
                     curr_hidden_sheath_outputs['max_mstruct'] = curr_hiddenzone_outputs['leaf_enclosed_mstruct'] * share_hidden_sheath
                     curr_hidden_sheath_outputs['Nstruct'] = curr_hiddenzone_outputs['leaf_enclosed_Nstruct'] * share_hidden_sheath
@@ -307,12 +293,11 @@ class Simulation(object):
                     curr_hidden_sheath_outputs['amino_acids'] = curr_hiddenzone_outputs['amino_acids'] * share_leaf * share_hidden_sheath
                     curr_hidden_sheath_outputs['fructan'] = curr_hiddenzone_outputs['fructan'] * share_leaf * share_hidden_sheath
                     curr_hidden_sheath_outputs['proteins'] = curr_hiddenzone_outputs['proteins'] * share_leaf * share_hidden_sheath
-                    self.outputs['elements'][hidden_sheath_id] = curr_hidden_sheath_outputs
 
                     # Add to hidden part of the lamina, if any
                     if share_hidden_sheath < 1:
-                        hidden_lamina_id = hiddenzone_id + tuple(['blade', 'HiddenElement'])
-                        curr_hidden_lamina_outputs = self.outputs['elements'][hidden_lamina_id]
+                        hidden_lamina_id = hiddenzone_id + ('blade', 'HiddenElement')
+                        curr_hidden_lamina_outputs = all_elements_outputs[hidden_lamina_id]
                         curr_hidden_lamina_outputs['mstruct'] = curr_hiddenzone_outputs['leaf_enclosed_mstruct'] * (1 - share_hidden_sheath)
                         curr_hidden_lamina_outputs['max_mstruct'] = curr_hiddenzone_outputs['leaf_enclosed_mstruct'] * (1 - share_hidden_sheath)
                         curr_hidden_lamina_outputs['Nstruct'] = curr_hiddenzone_outputs['leaf_enclosed_Nstruct'] * (1 - share_hidden_sheath)
@@ -320,10 +305,8 @@ class Simulation(object):
                         curr_hidden_lamina_outputs['amino_acids'] = curr_hiddenzone_outputs['amino_acids'] * share_leaf * (1 - share_hidden_sheath)
                         curr_hidden_lamina_outputs['fructan'] = curr_hiddenzone_outputs['fructan'] * share_leaf * (1 - share_hidden_sheath)
                         curr_hidden_lamina_outputs['proteins'] = curr_hiddenzone_outputs['proteins'] * share_leaf * (1 - share_hidden_sheath)
-                        self.outputs['elements'][hidden_lamina_id] = curr_hidden_lamina_outputs
 
                     # Remove in hiddenzone
-                    curr_hiddenzone_outputs = self.outputs['hiddenzone'][hiddenzone_id]
                     curr_hiddenzone_outputs['leaf_enclosed_mstruct'] = 0
                     curr_hiddenzone_outputs['leaf_enclosed_Nstruct'] = 0
                     curr_hiddenzone_outputs['mstruct'] = curr_hiddenzone_outputs['internode_enclosed_mstruct']
@@ -332,21 +315,20 @@ class Simulation(object):
                     curr_hiddenzone_outputs['amino_acids'] -= curr_hiddenzone_outputs['amino_acids'] * share_leaf
                     curr_hiddenzone_outputs['fructan'] -= curr_hiddenzone_outputs['fructan'] * share_leaf
                     curr_hiddenzone_outputs['proteins'] -= curr_hiddenzone_outputs['proteins'] * share_leaf
-                    self.outputs['hiddenzone'][hiddenzone_id] = curr_hiddenzone_outputs
 
                     # Turn remobilizing flag to False
-                    self.outputs['hiddenzone'][hiddenzone_id]['leaf_is_remobilizing'] = False
+                    curr_hiddenzone_outputs['leaf_is_remobilizing'] = False
 
                 # -- Remobilisation at the end of internode elongation
                 # Internodes stop to elongate after leaves. We cannot test delta_internode_L > 0 for the cases of short internodes which are mature before GA production.
                 if hiddenzone_inputs['internode_is_remobilizing']:
 
                     # Add to hidden part of the internode
-                    hidden_internode_id = hiddenzone_id + tuple(['internode', 'HiddenElement'])
-                    if hidden_internode_id not in self.outputs['elements'].keys():
+                    hidden_internode_id = hiddenzone_id + ('internode', 'HiddenElement')
+                    if hidden_internode_id not in all_elements_outputs:
                         new_internode_outputs = parameters.OrganInit().__dict__
-                        self.outputs['elements'][hidden_internode_id] = new_internode_outputs
-                    curr_hidden_internode_outputs = self.outputs['elements'][hidden_internode_id]
+                        all_elements_outputs[hidden_internode_id] = new_internode_outputs
+                    curr_hidden_internode_outputs = all_elements_outputs[hidden_internode_id]
                     curr_hidden_internode_outputs['mstruct'] += curr_hiddenzone_outputs['internode_enclosed_mstruct']
                     curr_hidden_internode_outputs['max_mstruct'] = curr_hidden_internode_outputs['mstruct']
                     curr_hidden_internode_outputs['Nstruct'] += curr_hiddenzone_outputs['internode_enclosed_Nstruct']
@@ -355,13 +337,12 @@ class Simulation(object):
                     curr_hidden_internode_outputs['fructan'] += curr_hiddenzone_outputs['fructan']
                     curr_hidden_internode_outputs['proteins'] += curr_hiddenzone_outputs['proteins']
                     curr_hidden_internode_outputs['is_growing'] = False
-                    self.outputs['elements'][hidden_internode_id] = curr_hidden_internode_outputs
 
                     # Turn remobilizing flag to False
-                    self.outputs['hiddenzone'][hiddenzone_id]['internode_is_remobilizing'] = False
+                    curr_hiddenzone_outputs['internode_is_remobilizing'] = False
 
                     #: Turn the flag to true after remobilisation in order to Delete Hiddenzone in both MTG and shared_outputs
-                    self.outputs['hiddenzone'][hiddenzone_id]['is_over'] = True
+                    curr_hiddenzone_outputs['is_over'] = True
 
         # --------------------------------
         # -------------- Roots -----------
@@ -369,11 +350,8 @@ class Simulation(object):
         for root_id, root_inputs in all_roots_inputs.items():
             curr_root_outputs = all_roots_outputs[root_id]
 
-            axe_id = root_id[:2]
-            curr_axis_outputs = all_axes_outputs[axe_id]
-
             # Temperature-compensated time (delta_teq)
-            delta_teq = all_axes_inputs[axe_id]['delta_teq_roots']
+            delta_teq = all_axes_inputs[root_id[:2]]['delta_teq_roots']
 
             # Growth
             mstruct_C_growth, mstruct_growth, Nstruct_growth, Nstruct_N_growth = model.calculate_roots_mstruct_growth(root_inputs['sucrose'], root_inputs['amino_acids'],
@@ -389,7 +367,3 @@ class Simulation(object):
             curr_root_outputs['Nstruct'] += Nstruct_growth
             curr_root_outputs['amino_acids'] -= curr_root_outputs['AA_consumption_mstruct']
             curr_root_outputs['delta_mstruct_growth'] = mstruct_growth
-            self.outputs['roots'][root_id] = curr_root_outputs
-
-            # Update of axis outputs
-            self.outputs['axes'][axe_id] = curr_axis_outputs
@@ -67,15 +67,20 @@ def compare_actual_to_desired(data_dirpath, actual_data_df, desired_data_filenam
         actual_data_df.to_csv(desired_data_filepath, na_rep='NA', index=False)
 
     else:
-        # keep only numerical data
-        for column in ('axis', 'organ', 'element', 'leaf_is_emerged', 'internode_is_visible', 'leaf_is_remobilizing', 'internode_is_remobilizing', 'is_growing', 'is_over'):
-            if column in desired_data_df.columns:
+        # same columns in the same order
+        assert list(actual_data_df.columns) == list(desired_data_df.columns)
+
+        # compare the non-numerical data, and keep only numerical data
+        non_numerical_columns = ('axis', 'organ', 'element', 'leaf_is_emerged', 'internode_is_visible', 'leaf_is_remobilizing', 'internode_is_remobilizing', 'is_growing', 'is_over')
+        numerical_columns = []
+        for column in desired_data_df.columns:
+            if column in non_numerical_columns:
                 assert desired_data_df[column].equals(actual_data_df[column])
-                del desired_data_df[column]
-                del actual_data_df[column]
+            else:
+                numerical_columns.append(column)
 
         # compare to the desired data
-        np.testing.assert_allclose(actual_data_df.values, desired_data_df.values, RELATIVE_TOLERANCE, ABSOLUTE_TOLERANCE)
+        np.testing.assert_allclose(actual_data_df[numerical_columns].to_numpy(), desired_data_df[numerical_columns].to_numpy(), RELATIVE_TOLERANCE, ABSOLUTE_TOLERANCE)
 
 
 def test_run(overwrite_desired_data=False):